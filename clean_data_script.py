@@ -5,61 +5,179 @@ This script addresses all identified data quality issues.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from schema import NUMERIC_DTYPES
+
+# Usage records are streamed rather than loaded whole; rows per chunk
+USAGE_CHUNKSIZE = 100_000
+
+def read_table(path, date_cols=(), category_cols=()):
+    """Read a CSV with the Arrow parser, typing date, label and numeric columns during the read"""
+    dtypes = dict(NUMERIC_DTYPES)
+    dtypes.update({col: 'datetime64[ns]' for col in date_cols})
+    dtypes.update({col: 'category' for col in category_cols})
+    return pd.read_csv(path, engine='pyarrow', dtype=dtypes)
+
+def recode_categories(series, mapping):
+    """Collapse label variants by rewriting the categories, not every row"""
+    if not series.cat.categories.isin(list(mapping)).any():
+        return series
+    
+    relabelled = series.cat.categories.map(lambda label: mapping.get(label, label))
+    categories = relabelled.unique()
+    
+    # Old code -> new code; the trailing -1 keeps missing values (code -1) missing
+    lookup = np.append(categories.get_indexer(relabelled), -1).astype(series.cat.codes.dtype)
+    codes = lookup[series.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories),
+        index=series.index,
+        name=series.name
+    )
+
+def category_mask(series, label):
+    """Rows equal to `label`, compared on the integer category codes"""
+    categories = series.cat.categories
+    if label not in categories:
+        return pd.Series(False, index=series.index)
+    return series.cat.codes == categories.get_loc(label)
+
 def load_raw_data():
     """Load raw data files"""
     print("Loading raw data files...")
     
-    subscribers = pd.read_csv('data/subscribers.csv')
-    usage = pd.read_csv('data/usage_records.csv')
-    billing = pd.read_csv('data/billing.csv')
-    tickets = pd.read_csv('data/tickets.csv')
-    outages = pd.read_csv('data/network_outages.csv')
-    
-    # Convert dates
-    subscribers['activation_date'] = pd.to_datetime(subscribers['activation_date'])
-    subscribers['churn_date'] = pd.to_datetime(subscribers['churn_date'])
-    usage['usage_date'] = pd.to_datetime(usage['usage_date'])
-    billing['bill_date'] = pd.to_datetime(billing['bill_date'])
-    billing['due_date'] = pd.to_datetime(billing['due_date'])
-    billing['payment_date'] = pd.to_datetime(billing['payment_date'])
-    tickets['ticket_date'] = pd.to_datetime(tickets['ticket_date'])
-    tickets['resolution_date'] = pd.to_datetime(tickets['resolution_date'])
-    outages['outage_start_time'] = pd.to_datetime(outages['outage_start_time'])
-    outages['outage_end_time'] = pd.to_datetime(outages['outage_end_time'])
-    
-    return subscribers, usage, billing, tickets, outages
+    subscribers = read_table(
+        'data/subscribers.csv',
+        date_cols=['activation_date', 'churn_date'],
+        category_cols=['city', 'plan_type', 'plan_name', 'status']
+    )
+    billing = read_table(
+        'data/billing.csv',
+        date_cols=['bill_date', 'due_date', 'payment_date'],
+        category_cols=['payment_status']
+    )
+    tickets = read_table(
+        'data/tickets.csv',
+        date_cols=['ticket_date', 'resolution_date'],
+        category_cols=['ticket_category', 'ticket_status', 'ticket_channel']
+    )
+    outages = read_table(
+        'data/network_outages.csv',
+        date_cols=['outage_start_time', 'outage_end_time'],
+        category_cols=['affected_city', 'outage_type']
+    )
+    
+    return subscribers, billing, tickets, outages
 
-def remove_duplicates(subscribers, usage, billing, tickets, outages):
-    """Remove duplicate records based on primary keys"""
-    print("\n1. Removing duplicates...")
+def read_usage_chunks(columns=None):
+    """Stream usage_records.csv in chunks so peak memory stays bounded"""
+    date_cols = ['usage_date'] if columns is None or 'usage_date' in columns else []
+    return pd.read_csv(
+        'data/usage_records.csv',
+        usecols=columns,
+        dtype=NUMERIC_DTYPES,
+        parse_dates=date_cols,
+        date_format='ISO8601',
+        chunksize=USAGE_CHUNKSIZE
+    )
+
+def drop_seen_usage(chunk, seen_ids):
+    """Drop usage_ids repeated within the chunk or already seen in an earlier one"""
+    ids = chunk['usage_id'].to_numpy()
+    seen_before = np.fromiter(map(seen_ids.__contains__, ids), dtype=bool, count=len(ids))
+    duplicate = chunk['usage_id'].duplicated().to_numpy() | seen_before
+    seen_ids.update(ids[~duplicate])
+    return chunk[~duplicate]
+
+def usage_subscriber_averages():
+    """First pass over usage: per-subscriber mean data_usage_gb and missing count"""
+    seen_ids = set()
+    totals = pd.DataFrame({'sum': pd.Series(dtype='float64'), 'count': pd.Series(dtype='int64')})
+    missing_usage = 0
+    
+    for chunk in read_usage_chunks(['usage_id', 'subscriber_id', 'data_usage_gb']):
+        chunk = drop_seen_usage(chunk, seen_ids)
+        missing_usage += chunk['data_usage_gb'].isna().sum()
+        
+        part = chunk.groupby('subscriber_id')['data_usage_gb'].agg(['sum', 'count'])
+        totals = totals.add(part, fill_value=0)
     
-    orig_sub = len(subscribers)
-    subscribers = subscribers.drop_duplicates(subset=['subscriber_id'], keep='first')
-    print(f"   Subscribers: Removed {orig_sub - len(subscribers)} duplicates")
+    return (totals['sum'] / totals['count']).astype('float32'), missing_usage
+
+def clean_usage_chunk(chunk, sub_avg, activation_by_sub):
+    """Impute, cap and date-check one chunk of usage records"""
+    # Subscribers with no recorded usage at all fall back to 0
+    chunk['data_usage_gb'] = chunk['data_usage_gb'].fillna(
+        chunk['subscriber_id'].map(sub_avg)
+    ).fillna(0)
     
-    orig_usage = len(usage)
-    usage = usage.drop_duplicates(subset=['usage_id'], keep='first')
-    print(f"   Usage: Removed {orig_usage - len(usage)} duplicates")
+    # Cap extreme data usage at 100 GB, flag for review
+    extreme_usage_mask = chunk['data_usage_gb'] > 100
+    chunk['outlier_flag'] = extreme_usage_mask
+    chunk.loc[extreme_usage_mask, 'data_usage_gb'] = 100
     
-    orig_bill = len(billing)
-    billing = billing.drop_duplicates(subset=['bill_id'], keep='first')
-    print(f"   Billing: Removed {orig_bill - len(billing)} duplicates")
+    # Remove usage records before activation
+    activation = chunk['subscriber_id'].map(activation_by_sub)
+    valid = chunk['usage_date'] >= activation
     
-    orig_ticket = len(tickets)
-    tickets = tickets.drop_duplicates(subset=['ticket_id'], keep='first')
-    print(f"   Tickets: Removed {orig_ticket - len(tickets)} duplicates")
+    return chunk[valid], extreme_usage_mask.sum(), (~valid).sum()
+
+def clean_usage_in_chunks(subscribers, sub_avg, missing_usage):
+    """Clean usage records chunk by chunk, appending each chunk to Parquet"""
+    print("\n2. Cleaning usage records in chunks...")
     
-    orig_outage = len(outages)
-    outages = outages.drop_duplicates(subset=['outage_id'], keep='first')
-    print(f"   Outages: Removed {orig_outage - len(outages)} duplicates")
+    activation_by_sub = subscribers.set_index('subscriber_id')['activation_date']
     
-    return subscribers, usage, billing, tickets, outages
+    Path("data_cleaned").mkdir(exist_ok=True)
+    
+    seen_ids = set()
+    stats = {'duplicates': 0, 'capped': 0, 'before_activation': 0, 'rows': 0, 'outliers': 0}
+    writer = None
+    try:
+        for chunk in read_usage_chunks():
+            orig_usage = len(chunk)
+            chunk = drop_seen_usage(chunk, seen_ids)
+            stats['duplicates'] += orig_usage - len(chunk)
+            
+            chunk, capped, before_activation = clean_usage_chunk(chunk, sub_avg, activation_by_sub)
+            stats['capped'] += capped
+            stats['before_activation'] += before_activation
+            stats['rows'] += len(chunk)
+            stats['outliers'] += chunk['outlier_flag'].sum()
+            
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(
+                    'data_cleaned/usage_records_clean.parquet', schema, compression='snappy'
+                )
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    print(f"   Removed {stats['duplicates']} duplicates")
+    print(f"   Imputed {missing_usage} missing data_usage_gb values")
+    print(f"   Capped {stats['capped']} extreme data usage values at 100 GB")
+    print(f"   Removed {stats['before_activation']} usage records before activation")
+    print("   ✓ Saved to data_cleaned/usage_records_clean.parquet")
+    
+    return stats
 
-def standardize_labels(subscribers, usage, billing, tickets, outages):
-    """Standardize inconsistent labels"""
-    print("\n2. Standardizing labels...")
+def clean_subscribers(subscribers):
+    """Remove duplicate subscribers and standardize their labels"""
+    report = ["   Subscribers:"]
+    
+    orig_sub = len(subscribers)
+    # drop_duplicates can hand back a slice of the input; copying it avoids
+    # chained-assignment warnings when columns are set below
+    subscribers = subscribers.drop_duplicates(subset=['subscriber_id'], keep='first').copy()
+    report.append(f"      Removed {orig_sub - len(subscribers)} duplicates")
     
     # Plan types
     plan_type_mapping = {
@@ -70,8 +188,8 @@ def standardize_labels(subscribers, usage, billing, tickets, outages):
         'POSTPAID': 'Postpaid',
         'Post-paid': 'Postpaid'
     }
-    subscribers['plan_type'] = subscribers['plan_type'].replace(plan_type_mapping)
-    print(f"   Standardized plan types: {subscribers['plan_type'].unique()}")
+    subscribers['plan_type'] = recode_categories(subscribers['plan_type'], plan_type_mapping)
+    report.append(f"      Standardized plan types: {list(subscribers['plan_type'].cat.categories)}")
     
     # Cities
     city_mapping = {
@@ -81,161 +199,142 @@ def standardize_labels(subscribers, usage, billing, tickets, outages):
         'dubai': 'Dubai',
         'DUBAI': 'Dubai'
     }
-    subscribers['city'] = subscribers['city'].replace(city_mapping)
-    print(f"   Standardized cities: {subscribers['city'].unique()}")
+    subscribers['city'] = recode_categories(subscribers['city'], city_mapping)
+    report.append(f"      Standardized cities: {list(subscribers['city'].cat.categories)}")
     
-    # Ticket status
-    status_mapping = {
-        'resolved': 'Resolved',
-        'RESOLVED': 'Resolved',
-        'Closed': 'Resolved',
-        'open': 'Open',
-        'OPEN': 'Open'
-    }
-    tickets['ticket_status'] = tickets['ticket_status'].replace(status_mapping)
-    print(f"   Standardized ticket statuses: {tickets['ticket_status'].unique()}")
-    
-    return subscribers, usage, billing, tickets, outages
+    return subscribers, report
 
-def handle_missing_values(subscribers, usage, billing, tickets, outages):
-    """Handle missing values"""
-    print("\n3. Handling missing values...")
-    
-    # Impute missing data_usage_gb with subscriber average
-    missing_usage = usage['data_usage_gb'].isna().sum()
-    print(f"   Found {missing_usage} missing data_usage_gb values")
-    
-    for sub_id in usage[usage['data_usage_gb'].isna()]['subscriber_id'].unique():
-        sub_avg = usage[
-            (usage['subscriber_id'] == sub_id) & 
-            (usage['data_usage_gb'].notna())
-        ]['data_usage_gb'].mean()
-        
-        if pd.notna(sub_avg):
-            usage.loc[
-                (usage['subscriber_id'] == sub_id) & 
-                (usage['data_usage_gb'].isna()), 
-                'data_usage_gb'
-            ] = sub_avg
-        else:
-            usage.loc[
-                (usage['subscriber_id'] == sub_id) & 
-                (usage['data_usage_gb'].isna()), 
-                'data_usage_gb'
-            ] = 0
+def clean_billing(billing):
+    """Remove duplicate bills, flag suspect ones and drop negative amounts"""
+    report = ["   Billing:"]
     
-    print(f"   Imputed {missing_usage} missing data_usage_gb values")
+    orig_bill = len(billing)
+    billing = billing.drop_duplicates(subset=['bill_id'], keep='first').copy()
+    report.append(f"      Removed {orig_bill - len(billing)} duplicates")
     
     # Flag missing payment_date for Paid bills
-    missing_payment = billing[
-        (billing['payment_status'] == 'Paid') & 
+    missing_payment_mask = (
+        category_mask(billing['payment_status'], 'Paid') & 
         (billing['payment_date'].isna())
-    ].shape[0]
-    
-    billing['data_quality_flag'] = False
-    billing.loc[
-        (billing['payment_status'] == 'Paid') & 
-        (billing['payment_date'].isna()),
-        'data_quality_flag'
-    ] = True
-    
-    print(f"   Flagged {missing_payment} bills with missing payment_date")
-    
-    # Flag missing resolution_date for Resolved tickets
-    missing_resolution = tickets[
-        (tickets['ticket_status'] == 'Resolved') & 
-        (tickets['resolution_date'].isna())
-    ].shape[0]
-    
-    tickets['data_quality_flag'] = False
-    tickets.loc[
-        (tickets['ticket_status'] == 'Resolved') & 
-        (tickets['resolution_date'].isna()),
-        'data_quality_flag'
-    ] = True
+    )
+    missing_payment = missing_payment_mask.sum()
+    billing['data_quality_flag'] = missing_payment_mask
     
-    print(f"   Flagged {missing_resolution} tickets with missing resolution_date")
+    report.append(f"      Flagged {missing_payment} bills with missing payment_date")
     
-    # Calculate missing outage_duration_mins
-    missing_duration = outages['outage_duration_mins'].isna().sum()
-    outages.loc[
-        outages['outage_duration_mins'].isna(),
-        'outage_duration_mins'
-    ] = (
-        outages['outage_end_time'] - outages['outage_start_time']
-    ).dt.total_seconds() / 60
+    # Flag extreme bills for review
+    extreme_bills_mask = billing['bill_amount'] > 2000
+    extreme_bills = extreme_bills_mask.sum()
+    billing.loc[extreme_bills_mask, 'data_quality_flag'] = True
+    report.append(f"      Flagged {extreme_bills} bills exceeding AED 2,000 for review")
     
-    print(f"   Calculated {missing_duration} missing outage durations")
+    # Remove negative bill amounts
+    negative_bills_mask = billing['bill_amount'] < 0
+    negative_bills = negative_bills_mask.sum()
+    billing = billing[~negative_bills_mask]
+    report.append(f"      Removed {negative_bills} bills with negative amounts")
     
-    return subscribers, usage, billing, tickets, outages
+    return billing, report
 
-def handle_outliers(subscribers, usage, billing, tickets, outages):
-    """Handle outlier values"""
-    print("\n4. Handling outliers...")
+def clean_tickets(tickets):
+    """Remove duplicate tickets, standardize statuses and fix resolution dates"""
+    report = ["   Tickets:"]
     
-    # Cap extreme data usage at 100 GB, flag for review
-    extreme_usage = (usage['data_usage_gb'] > 100).sum()
-    usage['outlier_flag'] = usage['data_usage_gb'] > 100
-    usage.loc[usage['data_usage_gb'] > 100, 'data_usage_gb'] = 100
-    print(f"   Capped {extreme_usage} extreme data usage values at 100 GB")
+    orig_ticket = len(tickets)
+    tickets = tickets.drop_duplicates(subset=['ticket_id'], keep='first').copy()
+    report.append(f"      Removed {orig_ticket - len(tickets)} duplicates")
     
-    # Flag extreme bills for review
-    extreme_bills = (billing['bill_amount'] > 2000).sum()
-    billing.loc[billing['bill_amount'] > 2000, 'data_quality_flag'] = True
-    print(f"   Flagged {extreme_bills} bills exceeding AED 2,000 for review")
+    # Ticket status
+    status_mapping = {
+        'resolved': 'Resolved',
+        'RESOLVED': 'Resolved',
+        'Closed': 'Resolved',
+        'open': 'Open',
+        'OPEN': 'Open'
+    }
+    tickets['ticket_status'] = recode_categories(tickets['ticket_status'], status_mapping)
+    report.append(f"      Standardized ticket statuses: {list(tickets['ticket_status'].cat.categories)}")
     
-    # Flag extreme outages
-    extreme_outages = (outages['outage_duration_mins'] > 1440).sum()
-    outages['outlier_flag'] = outages['outage_duration_mins'] > 1440
-    print(f"   Flagged {extreme_outages} outages exceeding 24 hours")
+    # Flag missing resolution_date for Resolved tickets
+    missing_resolution_mask = (
+        category_mask(tickets['ticket_status'], 'Resolved') & 
+        (tickets['resolution_date'].isna())
+    )
+    missing_resolution = missing_resolution_mask.sum()
+    tickets['data_quality_flag'] = missing_resolution_mask
     
-    return subscribers, usage, billing, tickets, outages
-
-def fix_impossible_values(subscribers, usage, billing, tickets, outages):
-    """Fix impossible values and date conflicts"""
-    print("\n5. Fixing impossible values...")
-    
-    # Remove negative bill amounts
-    negative_bills = (billing['bill_amount'] < 0).sum()
-    billing = billing[billing['bill_amount'] >= 0]
-    print(f"   Removed {negative_bills} bills with negative amounts")
+    report.append(f"      Flagged {missing_resolution} tickets with missing resolution_date")
     
     # Fix impossible ticket dates (resolution before creation)
-    impossible_tickets = (
-        tickets['resolution_date'] < tickets['ticket_date']
-    ).sum()
+    impossible_tickets_mask = tickets['resolution_date'] < tickets['ticket_date']
+    impossible_tickets = impossible_tickets_mask.sum()
     
-    tickets.loc[
-        tickets['resolution_date'] < tickets['ticket_date'],
-        'resolution_date'
-    ] = pd.NaT
+    tickets.loc[impossible_tickets_mask, 'resolution_date'] = pd.NaT
+    
+    # ticket_status is categorical, so 'In Progress' must be a category before
+    # it can be assigned (a dataset may have no ticket in that state)
+    if 'In Progress' not in tickets['ticket_status'].cat.categories:
+        tickets['ticket_status'] = tickets['ticket_status'].cat.add_categories(['In Progress'])
     tickets.loc[
         tickets['resolution_date'].isna() & 
-        (tickets['ticket_status'] == 'Resolved'),
+        category_mask(tickets['ticket_status'], 'Resolved'),
         'ticket_status'
     ] = 'In Progress'
     
-    print(f"   Fixed {impossible_tickets} tickets with impossible resolution dates")
+    report.append(f"      Fixed {impossible_tickets} tickets with impossible resolution dates")
     
-    # Remove usage records before activation
-    usage_merged = usage.merge(
-        subscribers[['subscriber_id', 'activation_date']], 
-        on='subscriber_id'
-    )
-    impossible_usage = (
-        usage_merged['usage_date'] < usage_merged['activation_date']
-    ).sum()
+    return tickets, report
+
+def clean_outages(outages):
+    """Remove duplicate outages, derive missing durations and flag long ones"""
+    report = ["   Outages:"]
     
-    valid_usage_ids = usage_merged[
-        usage_merged['usage_date'] >= usage_merged['activation_date']
-    ]['usage_id']
-    usage = usage[usage['usage_id'].isin(valid_usage_ids)]
+    orig_outage = len(outages)
+    outages = outages.drop_duplicates(subset=['outage_id'], keep='first').copy()
+    report.append(f"      Removed {orig_outage - len(outages)} duplicates")
+    
+    # Calculate missing outage_duration_mins
+    # Only the missing rows are derived, straight from the datetime64 arrays
+    missing_duration_mask = outages['outage_duration_mins'].isna().to_numpy()
+    missing_duration = missing_duration_mask.sum()
+    start = outages['outage_start_time'].to_numpy()[missing_duration_mask]
+    end = outages['outage_end_time'].to_numpy()[missing_duration_mask]
+    outages.loc[missing_duration_mask, 'outage_duration_mins'] = (
+        (end - start) / np.timedelta64(1, 'm')
+    ).astype(outages['outage_duration_mins'].dtype)
     
-    print(f"   Removed {impossible_usage} usage records before activation")
+    report.append(f"      Calculated {missing_duration} missing outage durations")
+    
+    # Flag extreme outages
+    extreme_outages_mask = outages['outage_duration_mins'] > 1440
+    extreme_outages = extreme_outages_mask.sum()
+    outages['outlier_flag'] = extreme_outages_mask
+    report.append(f"      Flagged {extreme_outages} outages exceeding 24 hours")
     
-    return subscribers, usage, billing, tickets, outages
+    return outages, report
 
-def generate_summary_report(subscribers, usage, billing, tickets, outages):
+def clean_tables(subscribers, billing, tickets, outages):
+    """Clean the independent tables one at a time, then take the usage first pass"""
+    print("\n1. Cleaning tables...")
+    
+    # Per-table cleaning takes well under a second at this data size, less
+    # than starting worker processes and pickling the frames to them
+    cleaned = []
+    for clean, table in [
+        (clean_subscribers, subscribers),
+        (clean_billing, billing),
+        (clean_tickets, tickets),
+        (clean_outages, outages)
+    ]:
+        table, report = clean(table)
+        print("\n".join(report))
+        cleaned.append(table)
+    
+    sub_avg, missing_usage = usage_subscriber_averages()
+    
+    return (*cleaned, sub_avg, missing_usage)
+
+def generate_summary_report(subscribers, billing, tickets, outages, usage_stats):
     """Generate data quality summary report"""
     print("\n" + "="*60)
     print("DATA CLEANING SUMMARY REPORT")
@@ -243,7 +342,7 @@ def generate_summary_report(subscribers, usage, billing, tickets, outages):
     
     print(f"\n📊 Final Record Counts:")
     print(f"   Subscribers: {len(subscribers):,}")
-    print(f"   Usage Records: {len(usage):,}")
+    print(f"   Usage Records: {usage_stats['rows']:,}")
     print(f"   Billing Records: {len(billing):,}")
     print(f"   Tickets: {len(tickets):,}")
     print(f"   Network Outages: {len(outages):,}")
@@ -251,7 +350,7 @@ def generate_summary_report(subscribers, usage, billing, tickets, outages):
     print(f"\n🚨 Remaining Data Quality Flags:")
     print(f"   Billing records flagged: {billing['data_quality_flag'].sum()}")
     print(f"   Tickets flagged: {tickets['data_quality_flag'].sum()}")
-    print(f"   Usage outliers: {usage['outlier_flag'].sum()}")
+    print(f"   Usage outliers: {usage_stats['outliers']}")
     print(f"   Outage outliers: {outages['outlier_flag'].sum()}")
     
     print(f"\n✅ Data Quality Improvements:")
@@ -263,18 +362,29 @@ def generate_summary_report(subscribers, usage, billing, tickets, outages):
     
     print("\n" + "="*60)
 
-def save_cleaned_data(subscribers, usage, billing, tickets, outages):
-    """Save cleaned data to new CSV files"""
-    print("\n6. Saving cleaned data...")
+def save_cleaned_data(subscribers, billing, tickets, outages):
+    """Save cleaned data to Parquet files (keeps dtypes and category labels)"""
+    print("\n3. Saving cleaned data...")
     
     # Create cleaned data directory
     Path("data_cleaned").mkdir(exist_ok=True)
     
-    subscribers.to_csv('data_cleaned/subscribers_clean.csv', index=False)
-    usage.to_csv('data_cleaned/usage_records_clean.csv', index=False)
-    billing.to_csv('data_cleaned/billing_clean.csv', index=False)
-    tickets.to_csv('data_cleaned/tickets_clean.csv', index=False)
-    outages.to_csv('data_cleaned/network_outages_clean.csv', index=False)
+    tables = {
+        'subscribers_clean': subscribers,
+        'billing_clean': billing,
+        'tickets_clean': tickets,
+        'network_outages_clean': outages,
+    }
+    
+    # Parquet writing releases the GIL, so the four files overlap on threads
+    # (usage_records_clean.parquet was already streamed out chunk by chunk)
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        list(executor.map(
+            lambda item: item[1].to_parquet(
+                f'data_cleaned/{item[0]}.parquet', index=False, compression='snappy'
+            ),
+            tables.items()
+        ))
     
     print("   ✓ Saved to data_cleaned/ directory")
 
@@ -285,34 +395,20 @@ def main():
     print("="*60)
     
     # Load data
-    subscribers, usage, billing, tickets, outages = load_raw_data()
-    
-    # Apply cleaning steps
-    subscribers, usage, billing, tickets, outages = remove_duplicates(
-        subscribers, usage, billing, tickets, outages
-    )
-    
-    subscribers, usage, billing, tickets, outages = standardize_labels(
-        subscribers, usage, billing, tickets, outages
-    )
-    
-    subscribers, usage, billing, tickets, outages = handle_missing_values(
-        subscribers, usage, billing, tickets, outages
-    )
-    
-    subscribers, usage, billing, tickets, outages = handle_outliers(
-        subscribers, usage, billing, tickets, outages
-    )
+    subscribers, billing, tickets, outages = load_raw_data()
     
-    subscribers, usage, billing, tickets, outages = fix_impossible_values(
-        subscribers, usage, billing, tickets, outages
+    # Clean each table independently, then stream usage against the cleaned
+    # subscribers (the only cross-table dependency is activation_date)
+    subscribers, billing, tickets, outages, sub_avg, missing_usage = clean_tables(
+        subscribers, billing, tickets, outages
     )
+    usage_stats = clean_usage_in_chunks(subscribers, sub_avg, missing_usage)
     
     # Save cleaned data
-    save_cleaned_data(subscribers, usage, billing, tickets, outages)
+    save_cleaned_data(subscribers, billing, tickets, outages)
     
     # Generate summary
-    generate_summary_report(subscribers, usage, billing, tickets, outages)
+    generate_summary_report(subscribers, billing, tickets, outages, usage_stats)
     
     print("\n✅ Data cleaning complete!")
     print("📁 Cleaned files available in data_cleaned/ directory")
@@ -1,12 +1,10 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
 from pathlib import Path
 
 # Set random seed for reproducibility
 np.random.seed(42)
-random.seed(42)
 
 # Configuration
 SUBSCRIBER_COUNT = 5000
@@ -88,60 +86,61 @@ OUTAGE_TYPES = {
     'Weather': 0.05
 }
 
-def weighted_choice(choices_dict):
-    """Select item based on weighted probabilities"""
+def weighted_choice(choices_dict, size):
+    """Draw `size` items based on weighted probabilities"""
     choices = list(choices_dict.keys())
     weights = list(choices_dict.values())
-    return random.choices(choices, weights=weights)[0]
+    return np.random.choice(choices, size, p=weights)
+
+def format_ids(prefix, count, width):
+    """Build sequential zero-padded IDs such as SUB000001"""
+    numbers = np.arange(1, count + 1).astype(str)
+    return np.char.add(prefix, np.char.zfill(numbers, width))
 
 def inject_inconsistent_labels(series, variations):
     """Inject label inconsistencies"""
-    result = series.copy()
-    num_changes = int(len(result) * 0.05)  # 5% variations
-    indices = np.random.choice(len(result), num_changes, replace=False)
+    values = series.to_numpy(dtype=object, copy=True)
+    num_changes = int(len(values) * 0.05)  # 5% variations
+    indices = np.random.choice(len(values), num_changes, replace=False)
     
-    for idx in indices:
-        original = result.iloc[idx]
-        if original in variations:
-            result.iloc[idx] = random.choice(variations[original])
+    for original, variants in variations.items():
+        targets = indices[values[indices] == original]
+        values[targets] = np.random.choice(variants, len(targets))
     
-    return result
+    return pd.Series(values, index=series.index, name=series.name)
 
 def generate_subscribers():
     """Generate subscribers table"""
     print("Generating subscribers...")
     
-    subscribers = []
-    for i in range(SUBSCRIBER_COUNT):
-        subscriber_id = f"SUB{str(i+1).zfill(6)}"
-        city = weighted_choice(CITIES)
-        plan_type = weighted_choice(PLAN_TYPES)
-        plan_name = weighted_choice(PLAN_NAMES)
-        status = weighted_choice(SUBSCRIBER_STATUS)
-        
-        min_charge, max_charge = PLAN_CHARGES[plan_name]
-        monthly_charge = round(random.uniform(min_charge, max_charge), 2)
-        
-        activation_date = ACTIVATION_START + timedelta(
-            days=random.randint(0, (END_DATE - ACTIVATION_START).days)
-        )
-        
-        churn_date = None
-        if status == 'Churned':
-            churn_date = activation_date + timedelta(days=random.randint(30, 700))
-        
-        subscribers.append({
-            'subscriber_id': subscriber_id,
-            'city': city,
-            'plan_type': plan_type,
-            'plan_name': plan_name,
-            'monthly_charge': monthly_charge,
-            'activation_date': activation_date,
-            'status': status,
-            'churn_date': churn_date
-        })
-    
-    df = pd.DataFrame(subscribers)
+    status = weighted_choice(SUBSCRIBER_STATUS, SUBSCRIBER_COUNT)
+    
+    plan_names = np.array(list(PLAN_NAMES))
+    plan_idx = np.random.choice(
+        len(plan_names), SUBSCRIBER_COUNT, p=list(PLAN_NAMES.values())
+    )
+    min_charge, max_charge = np.array([PLAN_CHARGES[name] for name in plan_names])[plan_idx].T
+    monthly_charge = np.round(np.random.uniform(min_charge, max_charge), 2)
+    
+    activation_date = ACTIVATION_START + pd.to_timedelta(
+        np.random.randint(0, (END_DATE - ACTIVATION_START).days + 1, SUBSCRIBER_COUNT),
+        unit='D'
+    )
+    
+    churn_date = (
+        activation_date + pd.to_timedelta(np.random.randint(30, 701, SUBSCRIBER_COUNT), unit='D')
+    ).where(status == 'Churned')
+    
+    df = pd.DataFrame({
+        'subscriber_id': format_ids('SUB', SUBSCRIBER_COUNT, 6),
+        'city': weighted_choice(CITIES, SUBSCRIBER_COUNT),
+        'plan_type': weighted_choice(PLAN_TYPES, SUBSCRIBER_COUNT),
+        'plan_name': plan_names[plan_idx],
+        'monthly_charge': monthly_charge.astype(np.float32),
+        'activation_date': activation_date,
+        'status': status,
+        'churn_date': churn_date
+    })
     
     # Inject duplicates (80 records)
     duplicate_indices = np.random.choice(df.index, 80, replace=False)
@@ -168,38 +167,34 @@ def generate_usage_records(subscribers):
     print("Generating usage records...")
     
     active_churned = subscribers[subscribers['status'].isin(['Active', 'Suspended'])]
-    
-    usage_records = []
-    for _ in range(USAGE_COUNT):
-        sub = active_churned.sample(1).iloc[0]
-        
-        # Generate usage date after activation
-        days_after_activation = (END_DATE - sub['activation_date']).days
-        if days_after_activation > 0:
-            usage_date = sub['activation_date'] + timedelta(
-                days=random.randint(0, min(days_after_activation, 120))
-            )
-        else:
-            usage_date = END_DATE - timedelta(days=random.randint(0, 120))
-        
-        # Generate usage metrics
-        data_usage = round(random.lognormal(3, 1.2), 2)  # Log-normal for realistic distribution
-        call_minutes = random.randint(0, 500)
-        sms_count = random.randint(0, 200)
-        roaming = random.choice([True, False]) if random.random() < 0.1 else False
-        roaming_charges = round(random.uniform(20, 200), 2) if roaming else 0
-        
-        usage_records.append({
-            'usage_id': f"USG{len(usage_records)+1:07d}",
-            'subscriber_id': sub['subscriber_id'],
-            'usage_date': usage_date,
-            'data_usage_gb': data_usage,
-            'call_minutes': call_minutes,
-            'sms_count': sms_count,
-            'roaming_charges': roaming_charges
-        })
-    
-    df = pd.DataFrame(usage_records)
+    sub_idx = np.random.randint(0, len(active_churned), USAGE_COUNT)
+    activation = pd.DatetimeIndex(active_churned['activation_date'].to_numpy()[sub_idx])
+    
+    # Generate usage date after activation
+    days_after_activation = (END_DATE - activation).days
+    usage_date = (activation + pd.to_timedelta(
+        np.random.randint(0, np.clip(days_after_activation, 0, 120) + 1), unit='D'
+    )).where(
+        days_after_activation > 0,
+        END_DATE - pd.to_timedelta(np.random.randint(0, 121, USAGE_COUNT), unit='D')
+    )
+    
+    # Generate usage metrics
+    data_usage = np.round(np.random.lognormal(3, 1.2, USAGE_COUNT), 2)  # Log-normal for realistic distribution
+    roaming = (np.random.random(USAGE_COUNT) < 0.1) & np.random.choice([True, False], USAGE_COUNT)
+    roaming_charges = np.where(
+        roaming, np.round(np.random.uniform(20, 200, USAGE_COUNT), 2), 0
+    )
+    
+    df = pd.DataFrame({
+        'usage_id': format_ids('USG', USAGE_COUNT, 7),
+        'subscriber_id': active_churned['subscriber_id'].to_numpy()[sub_idx],
+        'usage_date': usage_date,
+        'data_usage_gb': data_usage.astype(np.float32),
+        'call_minutes': np.random.randint(0, 501, USAGE_COUNT, dtype=np.int16),
+        'sms_count': np.random.randint(0, 201, USAGE_COUNT, dtype=np.int16),
+        'roaming_charges': roaming_charges.astype(np.float32)
+    })
     
     # Inject missing values (~500 records)
     missing_indices = np.random.choice(df.index, 500, replace=False)
@@ -207,14 +202,15 @@ def generate_usage_records(subscribers):
     
     # Inject outliers (30 records with >500 GB)
     outlier_indices = np.random.choice(df.index, 30, replace=False)
-    df.loc[outlier_indices, 'data_usage_gb'] = np.random.uniform(500, 1000, 30)
+    df.loc[outlier_indices, 'data_usage_gb'] = np.random.uniform(500, 1000, 30).astype(np.float32)
     
     # Inject impossible dates (10 records before activation)
     impossible_indices = np.random.choice(df.index, 10, replace=False)
-    for idx in impossible_indices:
-        sub_id = df.loc[idx, 'subscriber_id']
-        activation = subscribers[subscribers['subscriber_id'] == sub_id]['activation_date'].iloc[0]
-        df.loc[idx, 'usage_date'] = activation - timedelta(days=random.randint(1, 30))
+    activation_by_sub = subscribers.drop_duplicates('subscriber_id').set_index('subscriber_id')['activation_date']
+    activation = df.loc[impossible_indices, 'subscriber_id'].map(activation_by_sub)
+    df.loc[impossible_indices, 'usage_date'] = activation - pd.to_timedelta(
+        np.random.randint(1, 31, len(impossible_indices)), unit='D'
+    )
     
     return df
 
@@ -222,45 +218,54 @@ def generate_billing(subscribers):
     """Generate billing records"""
     print("Generating billing records...")
     
-    billing_records = []
-    
-    # Generate 3 months of bills for each subscriber
-    for _, sub in subscribers.iterrows():
-        if sub['status'] == 'Churned':
-            num_bills = random.randint(1, 3)
-        else:
-            num_bills = 3
-        
-        for month in range(num_bills):
-            bill_date = END_DATE - timedelta(days=90 - (month * 30))
-            due_date = bill_date + timedelta(days=15)
-            
-            # Calculate bill amount
-            base_charge = sub['monthly_charge']
-            addon_charges = round(random.uniform(0, 50), 2) if random.random() < 0.3 else 0
-            roaming_charges = round(random.uniform(20, 200), 2) if random.random() < 0.1 else 0
-            bill_amount = round(base_charge + addon_charges + roaming_charges, 2)
-            
-            payment_status = weighted_choice(PAYMENT_STATUS)
-            
-            payment_date = None
-            if payment_status == 'Paid':
-                payment_date = due_date - timedelta(days=random.randint(0, 10))
-            elif payment_status == 'Partial':
-                payment_date = due_date + timedelta(days=random.randint(0, 20))
-                bill_amount *= 0.5  # Partial payment
-            
-            billing_records.append({
-                'bill_id': f"BILL{len(billing_records)+1:07d}",
-                'subscriber_id': sub['subscriber_id'],
-                'bill_date': bill_date,
-                'due_date': due_date,
-                'bill_amount': bill_amount,
-                'payment_status': payment_status,
-                'payment_date': payment_date
-            })
-    
-    df = pd.DataFrame(billing_records).sample(BILLING_COUNT, replace=False).reset_index(drop=True)
+    # Generate 3 months of bills for each subscriber (1-3 for churned)
+    status = subscribers['status'].to_numpy()
+    num_bills = np.where(
+        status == 'Churned', np.random.randint(1, 4, len(subscribers)), 3
+    )
+    sub_idx = np.repeat(np.arange(len(subscribers)), num_bills)
+    month = np.arange(len(sub_idx)) - np.repeat(np.cumsum(num_bills) - num_bills, num_bills)
+    
+    # Pick the BILLING_COUNT bills to keep first, so per-bill values are
+    # only drawn for kept rows instead of being generated and discarded
+    keep = np.random.choice(len(sub_idx), min(BILLING_COUNT, len(sub_idx)), replace=False)
+    bill_ids = format_ids('BILL', len(sub_idx), 7)[keep]
+    sub_idx = sub_idx[keep]
+    month = month[keep]
+    count = len(keep)
+    
+    bill_date = END_DATE - pd.to_timedelta(90 - month * 30, unit='D')
+    due_date = bill_date + timedelta(days=15)
+    
+    # Calculate bill amount
+    base_charge = subscribers['monthly_charge'].to_numpy()[sub_idx]
+    addon_charges = np.where(
+        np.random.random(count) < 0.3, np.round(np.random.uniform(0, 50, count), 2), 0
+    )
+    roaming_charges = np.where(
+        np.random.random(count) < 0.1, np.round(np.random.uniform(20, 200, count), 2), 0
+    )
+    bill_amount = np.round(base_charge + addon_charges + roaming_charges, 2)
+    
+    payment_status = weighted_choice(PAYMENT_STATUS, count)
+    paid = payment_status == 'Paid'
+    partial = payment_status == 'Partial'
+    
+    payment_offset = np.where(
+        paid, -np.random.randint(0, 11, count), np.random.randint(0, 21, count)
+    )
+    payment_date = (due_date + pd.to_timedelta(payment_offset, unit='D')).where(paid | partial)
+    bill_amount = np.where(partial, bill_amount * 0.5, bill_amount)  # Partial payment
+    
+    df = pd.DataFrame({
+        'bill_id': bill_ids,
+        'subscriber_id': subscribers['subscriber_id'].to_numpy()[sub_idx],
+        'bill_date': bill_date,
+        'due_date': due_date,
+        'bill_amount': bill_amount.astype(np.float32),
+        'payment_status': payment_status,
+        'payment_date': payment_date
+    })
     
     # Inject duplicates (40 records)
     duplicate_indices = np.random.choice(df.index, 40, replace=False)
@@ -274,11 +279,11 @@ def generate_billing(subscribers):
     
     # Inject outliers (20 bills >5000 AED)
     outlier_indices = np.random.choice(df.index, 20, replace=False)
-    df.loc[outlier_indices, 'bill_amount'] = np.random.uniform(5000, 10000, 20)
+    df.loc[outlier_indices, 'bill_amount'] = np.random.uniform(5000, 10000, 20).astype(np.float32)
     
     # Inject impossible values (5 negative bills)
     negative_indices = np.random.choice(df.index, 5, replace=False)
-    df.loc[negative_indices, 'bill_amount'] = -np.random.uniform(50, 200, 5)
+    df.loc[negative_indices, 'bill_amount'] = -np.random.uniform(50, 200, 5).astype(np.float32)
     
     return df
 
@@ -286,31 +291,27 @@ def generate_tickets(subscribers):
     """Generate support tickets"""
     print("Generating tickets...")
     
-    tickets = []
-    for i in range(TICKET_COUNT):
-        sub = subscribers.sample(1).iloc[0]
-        
-        ticket_date = START_DATE + timedelta(days=random.randint(0, 120))
-        category = weighted_choice(TICKET_CATEGORIES)
-        status = weighted_choice(TICKET_STATUS)
-        channel = weighted_choice(TICKET_CHANNELS)
-        
-        resolution_date = None
-        if status == 'Resolved':
-            resolution_hours = random.randint(1, 96)  # 1 to 96 hours
-            resolution_date = ticket_date + timedelta(hours=resolution_hours)
-        
-        tickets.append({
-            'ticket_id': f"TKT{i+1:07d}",
-            'subscriber_id': sub['subscriber_id'],
-            'ticket_date': ticket_date,
-            'ticket_category': category,
-            'ticket_status': status,
-            'ticket_channel': channel,
-            'resolution_date': resolution_date
-        })
-    
-    df = pd.DataFrame(tickets)
+    sub_idx = np.random.randint(0, len(subscribers), TICKET_COUNT)
+    
+    ticket_date = START_DATE + pd.to_timedelta(
+        np.random.randint(0, 121, TICKET_COUNT), unit='D'
+    )
+    status = weighted_choice(TICKET_STATUS, TICKET_COUNT)
+    
+    resolution_hours = np.random.randint(1, 97, TICKET_COUNT)  # 1 to 96 hours
+    resolution_date = (
+        ticket_date + pd.to_timedelta(resolution_hours, unit='h')
+    ).where(status == 'Resolved')
+    
+    df = pd.DataFrame({
+        'ticket_id': format_ids('TKT', TICKET_COUNT, 7),
+        'subscriber_id': subscribers['subscriber_id'].to_numpy()[sub_idx],
+        'ticket_date': ticket_date,
+        'ticket_category': weighted_choice(TICKET_CATEGORIES, TICKET_COUNT),
+        'ticket_status': status,
+        'ticket_channel': weighted_choice(TICKET_CHANNELS, TICKET_COUNT),
+        'resolution_date': resolution_date
+    })
     
     # Inject duplicates (60 records)
     duplicate_indices = np.random.choice(df.index, 60, replace=False)
@@ -331,9 +332,9 @@ def generate_tickets(subscribers):
     
     # Inject impossible dates (15 records)
     impossible_indices = np.random.choice(df[df['resolution_date'].notna()].index, 15, replace=False)
-    for idx in impossible_indices:
-        ticket_date = df.loc[idx, 'ticket_date']
-        df.loc[idx, 'resolution_date'] = ticket_date - timedelta(hours=random.randint(1, 48))
+    df.loc[impossible_indices, 'resolution_date'] = df.loc[impossible_indices, 'ticket_date'] - pd.to_timedelta(
+        np.random.randint(1, 49, len(impossible_indices)), unit='h'
+    )
     
     return df
 
@@ -341,39 +342,33 @@ def generate_outages():
     """Generate network outage records"""
     print("Generating network outages...")
     
-    outages = []
-    for i in range(OUTAGE_COUNT):
-        city = weighted_choice(CITIES)
-        outage_type = weighted_choice(OUTAGE_TYPES)
-        
-        outage_start = START_DATE + timedelta(
-            days=random.randint(0, 120),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )
-        
-        # Duration based on type
-        if outage_type == 'Planned Maintenance':
-            duration_mins = random.randint(60, 360)
-        elif outage_type == 'Weather':
-            duration_mins = random.randint(30, 180)
-        else:
-            duration_mins = random.randint(15, 720)
-        
-        outage_end = outage_start + timedelta(minutes=duration_mins)
-        affected_subscribers = random.randint(100, 5000)
-        
-        outages.append({
-            'outage_id': f"OUT{i+1:05d}",
-            'affected_city': city,
-            'outage_type': outage_type,
-            'outage_start_time': outage_start,
-            'outage_end_time': outage_end,
-            'outage_duration_mins': duration_mins,
-            'affected_subscribers': affected_subscribers
-        })
-    
-    df = pd.DataFrame(outages)
+    outage_type = weighted_choice(OUTAGE_TYPES, OUTAGE_COUNT)
+    
+    outage_start = START_DATE + (
+        pd.to_timedelta(np.random.randint(0, 121, OUTAGE_COUNT), unit='D') +
+        pd.to_timedelta(np.random.randint(0, 24, OUTAGE_COUNT), unit='h') +
+        pd.to_timedelta(np.random.randint(0, 60, OUTAGE_COUNT), unit='m')
+    )
+    
+    # Duration based on type
+    duration_mins = np.select(
+        [outage_type == 'Planned Maintenance', outage_type == 'Weather'],
+        [
+            np.random.randint(60, 361, OUTAGE_COUNT),
+            np.random.randint(30, 181, OUTAGE_COUNT)
+        ],
+        np.random.randint(15, 721, OUTAGE_COUNT)
+    )
+    
+    df = pd.DataFrame({
+        'outage_id': format_ids('OUT', OUTAGE_COUNT, 5),
+        'affected_city': weighted_choice(CITIES, OUTAGE_COUNT),
+        'outage_type': outage_type,
+        'outage_start_time': outage_start,
+        'outage_end_time': outage_start + pd.to_timedelta(duration_mins, unit='m'),
+        'outage_duration_mins': duration_mins.astype(np.float32),
+        'affected_subscribers': np.random.randint(100, 5001, OUTAGE_COUNT, dtype=np.int32)
+    })
     
     # Inject missing duration (~10 records)
     missing_indices = np.random.choice(df.index, 10, replace=False)
@@ -381,11 +376,11 @@ def generate_outages():
     
     # Inject outliers (10 outages >1440 minutes)
     outlier_indices = np.random.choice(df.index, 10, replace=False)
-    df.loc[outlier_indices, 'outage_duration_mins'] = np.random.uniform(1440, 2880, 10)
-    for idx in outlier_indices:
-        start = df.loc[idx, 'outage_start_time']
-        duration = df.loc[idx, 'outage_duration_mins']
-        df.loc[idx, 'outage_end_time'] = start + timedelta(minutes=duration)
+    outlier_durations = np.random.uniform(1440, 2880, 10).astype(np.float32)
+    df.loc[outlier_indices, 'outage_duration_mins'] = outlier_durations
+    df.loc[outlier_indices, 'outage_end_time'] = df.loc[outlier_indices, 'outage_start_time'] + pd.to_timedelta(
+        outlier_durations, unit='m'
+    )
     
     return df
 
@@ -0,0 +1,16 @@
+"""
+Column dtypes shared by the ConnectUAE cleaning script and dashboard
+"""
+
+# Narrow numeric dtypes; every value range fits (charges, GB and minutes
+# need no more than float32 precision)
+NUMERIC_DTYPES = {
+    'monthly_charge': 'float32',
+    'data_usage_gb': 'float32',
+    'call_minutes': 'int16',
+    'sms_count': 'int16',
+    'roaming_charges': 'float32',
+    'bill_amount': 'float32',
+    'outage_duration_mins': 'float32',
+    'affected_subscribers': 'int32'
+}
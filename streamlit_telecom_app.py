@@ -1,11 +1,18 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import io
+import os
+import tempfile
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from pathlib import Path
 
+from schema import NUMERIC_DTYPES
+
 # Page config
 st.set_page_config(
     page_title="ConnectUAE Dashboard",
@@ -15,53 +22,267 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-    <style>
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 20px;
-        border-radius: 10px;
-        border-left: 5px solid #1f77b4;
-    }
-    .stMetric {
-        background-color: white;
-        padding: 15px;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """Read the dashboard stylesheet once per server process"""
+    return (Path(__file__).parent / 'static' / 'style.css').read_text()
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+def read_csv_typed(path, date_cols=(), category_cols=()):
+    """Read a CSV with PyArrow, parsing dates as timestamps and labels as categories"""
+    column_types = {col: pa.timestamp('ns') for col in date_cols}
+    column_types.update({col: pa.dictionary(pa.int32(), pa.string()) for col in category_cols})
+    convert_options = pacsv.ConvertOptions(column_types=column_types)
+    df = pacsv.read_csv(path, convert_options=convert_options).to_pandas()
+    
+    # PyArrow keeps labels in order of first appearance; sort them so groupby
+    # output stays in label order
+    for col in category_cols:
+        df[col] = df[col].cat.reorder_categories(df[col].cat.categories.sort_values())
+    return df
+
+def fresh_parquet(path):
+    """Path of the Parquet copy of a CSV if it is at least as new as the CSV, else None"""
+    csv_path = Path(path)
+    parquet_path = csv_path.with_suffix('.parquet')
+    if csv_path.exists() and parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return parquet_path
+    return None
+
+def write_parquet_copy(df, parquet_path):
+    """Write the Parquet copy atomically; if the data directory is not writable the copy is skipped"""
+    # A temp file in the same directory is renamed into place, so another
+    # session never sees a half-written copy that fresh_parquet calls fresh
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=parquet_path.parent, prefix=parquet_path.name, suffix='.tmp')
+        os.close(fd)
+    except OSError:
+        return
+    try:
+        df.to_parquet(tmp_path, index=False, compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
+
+def read_table(path, date_cols=(), category_cols=()):
+    """Read a table from its Parquet copy, parsing the CSV only when that is missing or stale"""
+    parquet_path = fresh_parquet(path)
+    if parquet_path is not None:
+        df = pd.read_parquet(parquet_path)
+        # No-op for copies written with narrow dtypes; narrows copies from before
+        return df.astype({col: dtype for col, dtype in NUMERIC_DTYPES.items() if col in df}, copy=False)
+    
+    df = read_csv_typed(path, date_cols, category_cols)
+    df = df.astype({col: dtype for col, dtype in NUMERIC_DTYPES.items() if col in df}, copy=False)
+    write_parquet_copy(df, Path(path).with_suffix('.parquet'))
+    return df
+
+# (path, date columns, label columns) for each table
+DATA_FILES = {
+    'subscribers': ('data/subscribers.csv', ['activation_date', 'churn_date'],
+                    ['city', 'plan_type', 'plan_name', 'status']),
+    'usage': ('data/usage_records.csv', ['usage_date'], []),
+    'billing': ('data/billing.csv', ['bill_date', 'due_date', 'payment_date'],
+                ['payment_status']),
+    'tickets': ('data/tickets.csv', ['ticket_date', 'resolution_date'],
+                ['ticket_category', 'ticket_status', 'ticket_channel']),
+    'outages': ('data/network_outages.csv', ['outage_start_time', 'outage_end_time'],
+                ['affected_city', 'outage_type']),
+}
+
+@st.cache_data(show_spinner="Loading data...")
+def load_table(name):
+    """Load one data file; each view asks only for the tables it shows"""
+    try:
+        df = read_table(*DATA_FILES[name])
+    except FileNotFoundError:
+        st.error("Data files not found. Please run generate_data.py first.")
+        st.stop()
+    
+    if name == 'tickets':
+        # Resolution time and status flags are derived once here and cached with the frame
+        df['resolution_time_hours'] = (df['resolution_date'] - df['ticket_date']).dt.total_seconds() / 3600
+        df['is_open'] = df['ticket_status'].isin(['Open', 'In Progress']).to_numpy()
+        df['is_resolved'] = (df['ticket_status'] == 'Resolved').to_numpy()
+    elif name == 'billing':
+        # Overdue flag shared by the at-risk KPI and the overdue-by-city chart
+        df['is_overdue'] = (df['payment_status'] == 'Overdue').to_numpy()
+    
+    # Scan the dates once here so cache lookups never have to
+    df.attrs['fingerprint'] = (name, df.select_dtypes('datetime').max().tolist())
+    return df
+
+def csv_row_count(path):
+    """Data rows in a CSV, counted from its newlines without parsing (the generated files quote no newlines)"""
+    newlines = 0
+    last_byte = b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            newlines += block.count(b'\n')
+            last_byte = block[-1:]
+    # An unterminated last line is still a row; the header line is not
+    return max(newlines + (last_byte != b'\n') - 1, 0)
 
 @st.cache_data
-def load_data():
-    """Load all data files"""
+def table_row_count(name):
+    """Row count for the sidebar, from Parquet metadata or a CSV line count; the table itself is never loaded"""
+    path = DATA_FILES[name][0]
+    parquet_path = fresh_parquet(path)
+    if parquet_path is not None:
+        return pq.read_metadata(parquet_path).num_rows
     try:
-        subscribers = pd.read_csv('data/subscribers.csv')
-        usage = pd.read_csv('data/usage_records.csv')
-        billing = pd.read_csv('data/billing.csv')
-        tickets = pd.read_csv('data/tickets.csv')
-        outages = pd.read_csv('data/network_outages.csv')
-        
-        # Convert date columns
-        subscribers['activation_date'] = pd.to_datetime(subscribers['activation_date'])
-        subscribers['churn_date'] = pd.to_datetime(subscribers['churn_date'])
-        usage['usage_date'] = pd.to_datetime(usage['usage_date'])
-        billing['bill_date'] = pd.to_datetime(billing['bill_date'])
-        billing['due_date'] = pd.to_datetime(billing['due_date'])
-        billing['payment_date'] = pd.to_datetime(billing['payment_date'])
-        tickets['ticket_date'] = pd.to_datetime(tickets['ticket_date'])
-        tickets['resolution_date'] = pd.to_datetime(tickets['resolution_date'])
-        outages['outage_start_time'] = pd.to_datetime(outages['outage_start_time'])
-        outages['outage_end_time'] = pd.to_datetime(outages['outage_end_time'])
-        
-        return subscribers, usage, billing, tickets, outages
+        return csv_row_count(path)
     except FileNotFoundError:
         st.error("Data files not found. Please run generate_data.py first.")
         st.stop()
 
-def show_data_quality_report(subscribers, usage, billing, tickets, outages):
+def frame_fingerprint(df):
+    """Cheap cache key for a loaded frame: the load-time fingerprint, length and columns"""
+    # attrs carry over to slices of a loaded frame, so length and columns stay in the key
+    return (df.attrs.get('fingerprint'), len(df), tuple(df.columns))
+
+FRAME_HASH = {pd.DataFrame: frame_fingerprint}
+
+def fast_vc(series, weights=None):
+    """value_counts() for a categorical column via bincount on its codes, optionally weighted per row"""
+    codes = series.cat.codes.to_numpy()
+    present = codes >= 0
+    if weights is not None:
+        weights = np.asarray(weights)[present]
+    counts = np.bincount(codes[present], weights=weights, minlength=len(series.cat.categories))
+    counts = pd.Series(counts.astype('int64'), index=series.cat.categories.rename(series.name), name='count')
+    return counts.sort_values(ascending=False)
+
+def top_n(series, n):
+    """The n most frequent labels of a categorical column, picked with a partition instead of a full sort"""
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    if n < len(counts):
+        # Labels tied with the n-th largest count are taken in category order,
+        # so the pick does not depend on the order partition leaves them in
+        nth_largest = np.partition(counts, len(counts) - n)[len(counts) - n]
+        above = np.flatnonzero(counts > nth_largest)
+        tied = np.flatnonzero(counts == nth_largest)[:n - len(above)]
+        idx = np.sort(np.concatenate([above, tied]))
+    else:
+        idx = np.arange(len(counts))
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    return pd.Series(counts[idx], index=series.cat.categories[idx].rename(series.name), name='count')
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def column_counts(df, column, n=None):
+    """Value counts of a column as a frame with a 'count' column, optionally only the top n"""
+    counts = fast_vc(df[column]) if n is None else top_n(df[column], n)
+    return counts.reset_index()
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def monthly_arpu(billing):
+    """Revenue per billed subscriber for each bill month"""
+    # Group on an integer month number (year*12 + month-1) rather than Periods
+    bill_date = billing['bill_date']
+    month_key = (bill_date.dt.year * 12 + bill_date.dt.month - 1).rename('month')
+    monthly = billing.groupby(month_key).agg({
+        'bill_amount': 'sum',
+        'subscriber_id': 'nunique'
+    })
+    monthly['arpu'] = monthly['bill_amount'] / monthly['subscriber_id']
+    
+    # Back to month-start timestamps for the chart axis
+    months_since_epoch = monthly.index.to_numpy().astype('int64') - 1970 * 12
+    monthly.index = pd.DatetimeIndex(months_since_epoch.astype('datetime64[M]'), name='month')
+    return monthly
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def executive_kpis(subscribers, billing):
+    """Headline revenue and subscriber figures"""
+    total_revenue = billing['bill_amount'].sum()
+    active_subs = (subscribers['status'] == 'Active').sum()
+    # Revenue per billed subscriber-month, from the same aggregate as the trend
+    monthly = monthly_arpu(billing)
+    avg_arpu = monthly['bill_amount'].sum() / monthly['subscriber_id'].sum()
+    overdue_revenue = billing.loc[billing['is_overdue'], 'bill_amount'].sum()
+    return total_revenue, active_subs, avg_arpu, overdue_revenue
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def revenue_breakdowns(subscribers, billing):
+    """Revenue by plan type, by city, and overdue revenue by city"""
+    # Join only the columns the three breakdowns use
+    sub_slim = subscribers[['subscriber_id', 'plan_type', 'city']]
+    bill_slim = billing[['subscriber_id', 'bill_amount', 'is_overdue']]
+    sub_billing = sub_slim.merge(bill_slim, on='subscriber_id', how='inner', copy=False)
+    plan_revenue = sub_billing.groupby('plan_type', observed=True)['bill_amount'].sum().reset_index()
+    
+    city_revenue = sub_billing.groupby('city', observed=True)['bill_amount'].sum().reset_index()
+    city_revenue = city_revenue.sort_values('bill_amount', ascending=False)
+    
+    overdue_city = sub_billing[sub_billing['is_overdue']].groupby('city', observed=True)['bill_amount'].sum().reset_index()
+    return plan_revenue, city_revenue, overdue_city
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def ticket_kpis(tickets):
+    """Open ticket count, average resolution hours and 48h SLA rate"""
+    open_tickets = tickets['is_open'].sum()
+    
+    # Calculate avg resolution time
+    resolved = tickets[tickets['is_resolved']]
+    resolution_time = resolved['resolution_time_hours']
+    avg_resolution = resolution_time.mean()
+    
+    # SLA compliance (48 hours)
+    sla_compliant = (resolution_time <= 48).sum()
+    sla_rate = (sla_compliant / len(resolved) * 100) if len(resolved) > 0 else 0
+    return open_tickets, avg_resolution, sla_rate
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def category_resolution_hours(tickets):
+    """Average resolution hours per ticket category, slowest first"""
+    resolved = tickets[tickets['is_resolved']]
+    category_resolution = resolved.groupby('ticket_category', observed=True)['resolution_time_hours'].mean()
+    category_resolution = category_resolution.rename('resolution_time').reset_index()
+    return category_resolution.sort_values('resolution_time', ascending=False)
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def city_ticket_counts(subscribers, tickets):
+    """Ticket volume per subscriber city"""
+    # Weight each subscriber row by its ticket count instead of joining the
+    # frames; duplicate subscriber rows each count, as they did in the join
+    tickets_per_sub = tickets['subscriber_id'].value_counts()
+    weights = subscribers['subscriber_id'].map(tickets_per_sub).fillna(0).to_numpy()
+    return fast_vc(subscribers['city'], weights).reset_index()
+
+@st.cache_data(hash_funcs=FRAME_HASH)
+def to_csv_bytes(df, columns=None):
+    """Serialize a frame (optionally only some columns) to CSV bytes once, for the download buttons"""
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, columns=columns)
+    return buffer.getvalue()
+
+def bar_chart(df, x, y, title, color=None):
+    """Bar chart built directly with graph_objects from the columns' NumPy arrays, axis titles as in px.bar"""
+    fig = go.Figure(go.Bar(x=df[x].to_numpy(), y=df[y].to_numpy(), marker_color=color))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+def pie_chart(df, values, names, title):
+    """Pie chart built directly with graph_objects from the columns' NumPy arrays"""
+    fig = go.Figure(go.Pie(labels=df[names].to_numpy(), values=df[values].to_numpy()))
+    fig.update_layout(title=title)
+    return fig
+
+def line_chart(x, y, title):
+    """Line chart built directly with graph_objects"""
+    fig = go.Figure(go.Scatter(x=x, y=y, mode='lines'))
+    fig.update_layout(title=title)
+    return fig
+
+def show_data_quality_report():
     """Display data quality issues"""
     st.header("🔍 Data Quality Report")
+    subscribers = load_table('subscribers')
+    usage = load_table('usage')
+    billing = load_table('billing')
+    tickets = load_table('tickets')
     
     col1, col2, col3 = st.columns(3)
     
@@ -87,9 +308,12 @@ def show_data_quality_report(subscribers, usage, billing, tickets, outages):
     
     with col3:
         st.subheader("Data Issues")
-        outlier_usage = (usage['data_usage_gb'] > 500).sum()
-        outlier_bills = (billing['bill_amount'] > 5000).sum()
-        impossible_dates = (tickets['resolution_date'] < tickets['ticket_date']).sum()
+        # Plain NumPy comparisons; NaN and NaT compare False, as in pandas
+        outlier_usage = np.count_nonzero(usage['data_usage_gb'].to_numpy() > 500)
+        outlier_bills = np.count_nonzero(billing['bill_amount'].to_numpy() > 5000)
+        impossible_dates = np.count_nonzero(
+            tickets['resolution_date'].to_numpy() < tickets['ticket_date'].to_numpy()
+        )
         
         st.metric("Outlier Usage (>500GB)", outlier_usage)
         st.metric("Outlier Bills (>5000 AED)", outlier_bills)
@@ -101,28 +325,27 @@ def show_data_quality_report(subscribers, usage, billing, tickets, outages):
     
     with col1:
         st.write("**Plan Type Variations**")
-        st.write(subscribers['plan_type'].value_counts())
+        st.write(fast_vc(subscribers['plan_type']))
     
     with col2:
         st.write("**City Variations**")
-        st.write(subscribers['city'].value_counts().head(10))
+        st.write(top_n(subscribers['city'], 10))
     
     with col3:
         st.write("**Ticket Status Variations**")
-        st.write(tickets['ticket_status'].value_counts())
+        st.write(fast_vc(tickets['ticket_status']))
 
-def executive_view(subscribers, usage, billing, tickets, outages):
+def executive_view():
     """Executive dashboard view"""
     st.header("📊 Executive View - Revenue & Subscriber Health")
+    subscribers = load_table('subscribers')
+    billing = load_table('billing')
     
     # KPIs
     col1, col2, col3, col4 = st.columns(4)
     
     # Calculate metrics
-    total_revenue = billing['bill_amount'].sum()
-    active_subs = (subscribers['status'] == 'Active').sum()
-    avg_arpu = billing.groupby('subscriber_id')['bill_amount'].mean().mean()
-    overdue_revenue = billing[billing['payment_status'] == 'Overdue']['bill_amount'].sum()
+    total_revenue, active_subs, avg_arpu, overdue_revenue = executive_kpis(subscribers, billing)
     
     with col1:
         st.metric("Total Revenue (AED)", f"{total_revenue/1_000_000:.2f}M")
@@ -138,80 +361,55 @@ def executive_view(subscribers, usage, billing, tickets, outages):
     
     with col1:
         # ARPU Trend
-        billing['month'] = billing['bill_date'].dt.to_period('M')
-        monthly_arpu = billing.groupby('month').agg({
-            'bill_amount': 'sum',
-            'subscriber_id': 'nunique'
-        })
-        monthly_arpu['arpu'] = monthly_arpu['bill_amount'] / monthly_arpu['subscriber_id']
-        
-        fig = px.line(monthly_arpu, y='arpu', title='ARPU Trend by Month')
+        monthly = monthly_arpu(billing)
+        fig = line_chart(monthly.index.to_numpy(), monthly['arpu'].to_numpy(), 'ARPU Trend by Month')
         fig.update_layout(xaxis_title='Month', yaxis_title='ARPU (AED)')
         st.plotly_chart(fig, use_container_width=True)
     
+    plan_revenue, city_revenue, overdue_city = revenue_breakdowns(subscribers, billing)
+    
     with col2:
         # Revenue by Plan Type
-        sub_billing = subscribers.merge(billing, on='subscriber_id')
-        plan_revenue = sub_billing.groupby('plan_type')['bill_amount'].sum().reset_index()
-        
-        fig = px.pie(plan_revenue, values='bill_amount', names='plan_type', 
-                     title='Revenue Distribution by Plan Type')
+        fig = pie_chart(plan_revenue, 'bill_amount', 'plan_type', 'Revenue Distribution by Plan Type')
         st.plotly_chart(fig, use_container_width=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Revenue by City
-        city_revenue = sub_billing.groupby('city')['bill_amount'].sum().reset_index()
-        city_revenue = city_revenue.sort_values('bill_amount', ascending=False)
-        
-        fig = px.bar(city_revenue, x='city', y='bill_amount', 
-                     title='Total Revenue by City (AED)')
+        fig = bar_chart(city_revenue, 'city', 'bill_amount', 'Total Revenue by City (AED)')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Overdue by City
-        overdue_city = sub_billing[sub_billing['payment_status'] == 'Overdue'].groupby('city')['bill_amount'].sum().reset_index()
-        
-        fig = px.bar(overdue_city, x='city', y='bill_amount', 
-                     title='Overdue Payments by City (AED)', color_discrete_sequence=['#ff4444'])
+        fig = bar_chart(overdue_city, 'city', 'bill_amount', 'Overdue Payments by City (AED)', color='#ff4444')
         st.plotly_chart(fig, use_container_width=True)
     
     # Subscriber Status
     col1, col2 = st.columns(2)
     
     with col1:
-        status_counts = subscribers['status'].value_counts().reset_index()
-        fig = px.bar(status_counts, x='status', y='count', 
-                     title='Subscriber Status Distribution')
+        status_counts = column_counts(subscribers, 'status')
+        fig = bar_chart(status_counts, 'status', 'count', 'Subscriber Status Distribution')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Payment Status
-        payment_counts = billing['payment_status'].value_counts().reset_index()
-        fig = px.pie(payment_counts, values='count', names='payment_status',
-                     title='Payment Status Distribution')
+        payment_counts = column_counts(billing, 'payment_status')
+        fig = pie_chart(payment_counts, 'count', 'payment_status', 'Payment Status Distribution')
         st.plotly_chart(fig, use_container_width=True)
 
-def operations_view(subscribers, usage, billing, tickets, outages):
+def operations_view():
     """Operations manager dashboard view"""
     st.header("⚙️ Operations View - Service Quality & Network")
+    subscribers = load_table('subscribers')
+    tickets = load_table('tickets')
+    outages = load_table('outages')
     
     # KPIs
     col1, col2, col3, col4 = st.columns(4)
     
-    open_tickets = tickets[tickets['ticket_status'].isin(['Open', 'In Progress'])].shape[0]
-    resolved_tickets = tickets[tickets['ticket_status'] == 'Resolved'].shape[0]
-    
-    # Calculate avg resolution time
-    resolved = tickets[tickets['ticket_status'] == 'Resolved'].copy()
-    resolved['resolution_time'] = (resolved['resolution_date'] - resolved['ticket_date']).dt.total_seconds() / 3600
-    avg_resolution = resolved['resolution_time'].mean()
-    
-    # SLA compliance (48 hours)
-    sla_compliant = (resolved['resolution_time'] <= 48).sum()
-    sla_rate = (sla_compliant / len(resolved) * 100) if len(resolved) > 0 else 0
-    
+    open_tickets, avg_resolution, sla_rate = ticket_kpis(tickets)
     total_outage_mins = outages['outage_duration_mins'].sum()
     
     with col1:
@@ -228,70 +426,66 @@ def operations_view(subscribers, usage, billing, tickets, outages):
     
     with col1:
         # Top ticket categories
-        category_counts = tickets['ticket_category'].value_counts().reset_index().head(5)
-        fig = px.bar(category_counts, x='ticket_category', y='count',
-                     title='Top 5 Ticket Categories')
+        category_counts = column_counts(tickets, 'ticket_category', 5)
+        fig = bar_chart(category_counts, 'ticket_category', 'count', 'Top 5 Ticket Categories')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Tickets by channel
-        channel_counts = tickets['ticket_channel'].value_counts().reset_index()
-        fig = px.pie(channel_counts, values='count', names='ticket_channel',
-                     title='Tickets by Support Channel')
+        channel_counts = column_counts(tickets, 'ticket_channel')
+        fig = pie_chart(channel_counts, 'count', 'ticket_channel', 'Tickets by Support Channel')
         st.plotly_chart(fig, use_container_width=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Tickets by city
-        city_tickets = tickets.merge(subscribers[['subscriber_id', 'city']], on='subscriber_id')
-        city_ticket_counts = city_tickets['city'].value_counts().reset_index()
-        
-        fig = px.bar(city_ticket_counts, x='city', y='count',
-                     title='Ticket Volume by City')
+        fig = bar_chart(city_ticket_counts(subscribers, tickets), 'city', 'count', 'Ticket Volume by City')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Ticket status distribution
-        status_counts = tickets['ticket_status'].value_counts().reset_index()
-        fig = px.bar(status_counts, x='ticket_status', y='count',
-                     title='Ticket Status Distribution')
+        status_counts = column_counts(tickets, 'ticket_status')
+        fig = bar_chart(status_counts, 'ticket_status', 'count', 'Ticket Status Distribution')
         st.plotly_chart(fig, use_container_width=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Network outages by city
-        outage_city = outages['affected_city'].value_counts().reset_index()
-        fig = px.bar(outage_city, x='affected_city', y='count',
-                     title='Network Outage Incidents by City')
+        outage_city = column_counts(outages, 'affected_city')
+        fig = bar_chart(outage_city, 'affected_city', 'count', 'Network Outage Incidents by City')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Outage types
-        outage_types = outages['outage_type'].value_counts().reset_index()
-        fig = px.pie(outage_types, values='count', names='outage_type',
-                     title='Outage Types Distribution')
+        outage_types = column_counts(outages, 'outage_type')
+        fig = pie_chart(outage_types, 'count', 'outage_type', 'Outage Types Distribution')
         st.plotly_chart(fig, use_container_width=True)
     
     # Resolution time by category
     st.subheader("Average Resolution Time by Category")
-    category_resolution = resolved.groupby('ticket_category')['resolution_time'].mean().reset_index()
-    category_resolution = category_resolution.sort_values('resolution_time', ascending=False)
-    
-    fig = px.bar(category_resolution, x='ticket_category', y='resolution_time',
-                 title='Avg Resolution Time by Category (hours)')
+    fig = bar_chart(category_resolution_hours(tickets), 'ticket_category', 'resolution_time',
+                    'Avg Resolution Time by Category (hours)')
     st.plotly_chart(fig, use_container_width=True)
 
+# Raw Data Explorer choices -> (table name, download file name, columns
+# derived in load_table that are not part of the source file)
+EXPLORER_DATASETS = {
+    "Subscribers": ('subscribers', 'subscribers.csv', []),
+    "Usage Records": ('usage', 'usage_records.csv', []),
+    "Billing": ('billing', 'billing.csv', ['is_overdue']),
+    "Tickets": ('tickets', 'tickets.csv', ['resolution_time_hours', 'is_open', 'is_resolved']),
+    "Network Outages": ('outages', 'network_outages.csv', []),
+}
+
+EXPLORER_PAGE_SIZE = 1000
+
 def main():
     # Header
     st.title("📱 ConnectUAE - Revenue & Service Operations Dashboard")
     st.markdown("**Telecommunications Analytics Platform**")
     
-    # Load data
-    with st.spinner("Loading data..."):
-        subscribers, usage, billing, tickets, outages = load_data()
-    
     # Sidebar
     st.sidebar.title("Navigation")
     view = st.sidebar.radio(
@@ -302,45 +496,47 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.info(f"""
     **Data Summary**
-    - Subscribers: {len(subscribers):,}
-    - Usage Records: {len(usage):,}
-    - Billing Records: {len(billing):,}
-    - Tickets: {len(tickets):,}
-    - Network Outages: {len(outages):,}
+    - Subscribers: {table_row_count('subscribers'):,}
+    - Usage Records: {table_row_count('usage'):,}
+    - Billing Records: {table_row_count('billing'):,}
+    - Tickets: {table_row_count('tickets'):,}
+    - Network Outages: {table_row_count('outages'):,}
     """)
     
     # Display selected view
     if view == "Executive View":
-        executive_view(subscribers, usage, billing, tickets, outages)
+        executive_view()
     elif view == "Operations View":
-        operations_view(subscribers, usage, billing, tickets, outages)
+        operations_view()
     elif view == "Data Quality Report":
-        show_data_quality_report(subscribers, usage, billing, tickets, outages)
+        show_data_quality_report()
     else:
         st.header("📋 Raw Data Explorer")
-        dataset = st.selectbox("Select Dataset", 
-                              ["Subscribers", "Usage Records", "Billing", "Tickets", "Network Outages"])
+        dataset = st.selectbox("Select Dataset", list(EXPLORER_DATASETS))
+        
+        name, file_name, derived_columns = EXPLORER_DATASETS[dataset]
+        df = load_table(name)
+        
+        # Show and export only the source columns; selecting them on the page
+        # and in to_csv avoids copying the whole table
+        source_columns = list(df.columns.drop(derived_columns, errors='ignore'))
         
-        if dataset == "Subscribers":
-            st.dataframe(subscribers)
-            st.download_button("Download CSV", subscribers.to_csv(index=False), 
-                             "subscribers.csv", "text/csv")
-        elif dataset == "Usage Records":
-            st.dataframe(usage)
-            st.download_button("Download CSV", usage.to_csv(index=False), 
-                             "usage_records.csv", "text/csv")
-        elif dataset == "Billing":
-            st.dataframe(billing)
-            st.download_button("Download CSV", billing.to_csv(index=False), 
-                             "billing.csv", "text/csv")
-        elif dataset == "Tickets":
-            st.dataframe(tickets)
-            st.download_button("Download CSV", tickets.to_csv(index=False), 
-                             "tickets.csv", "text/csv")
+        # Only one page goes to the browser grid; the download has every row.
+        # Paging by page number keeps every page aligned to EXPLORER_PAGE_SIZE
+        if df.empty:
+            st.caption("No rows in this table")
+            st.dataframe(df[source_columns])
         else:
-            st.dataframe(outages)
-            st.download_button("Download CSV", outages.to_csv(index=False), 
-                             "network_outages.csv", "text/csv")
+            page_count = -(-len(df) // EXPLORER_PAGE_SIZE)
+            page_number = st.number_input("Page", 1, page_count, 1)
+            start = (page_number - 1) * EXPLORER_PAGE_SIZE
+            page = df.iloc[start:start + EXPLORER_PAGE_SIZE][source_columns]
+            st.caption(
+                f"Showing rows {start + 1:,}–{start + len(page):,} of {len(df):,} "
+                f"(page {page_number:,} of {page_count:,})"
+            )
+            st.dataframe(page)
+        st.download_button("Download CSV", to_csv_bytes(df, source_columns), file_name, "text/csv")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,247 @@
+"""
+Tests for the ConnectUAE data cleaning script
+Run with: python -m unittest
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import clean_data_script
+from clean_data_script import category_mask, clean_tickets, recode_categories
+from schema import NUMERIC_DTYPES
+
+# The dashboard helpers are only tested where the app's own dependencies are installed
+HAS_DASHBOARD_DEPS = all(importlib.util.find_spec(module) for module in ('streamlit', 'plotly'))
+
+USAGE_COLUMNS = ['usage_id', 'subscriber_id', 'usage_date', 'data_usage_gb',
+                 'call_minutes', 'sms_count', 'roaming_charges']
+
+# Streamed three rows at a time: U1 and U2 reappear in later chunks, U4 repeats
+# within a chunk, and S1's kept rows are spread over three chunks
+USAGE_ROWS = [
+    ('U1', 'S1', '2025-01-05', 2.0),
+    ('U2', 'S1', '2025-01-06', None),
+    ('U3', 'S2', '2025-01-05', 150.0),
+    ('U1', 'S1', '2025-01-07', 9.0),
+    ('U4', 'S1', '2025-01-08', 4.0),
+    ('U4', 'S1', '2025-01-09', 40.0),
+    ('U5', 'S2', '2025-01-06', None),
+    ('U6', 'S3', '2024-12-01', None),
+    ('U2', 'S1', '2025-01-09', 50.0),
+    ('U7', 'S1', '2025-01-10', 6.0),
+    ('U8', 'S2', '2025-01-07', 1.0),
+]
+
+
+class CleanTicketsTest(unittest.TestCase):
+    def test_resolved_without_date_when_in_progress_label_is_absent(self):
+        tickets = pd.DataFrame({
+            'ticket_id': ['TKT1', 'TKT2', 'TKT3'],
+            'ticket_date': pd.to_datetime(['2025-10-01', '2025-10-02', '2025-10-03']),
+            'ticket_status': pd.Categorical(['Resolved', 'Resolved', 'Open']),
+            'resolution_date': pd.to_datetime(['2025-09-30', '2025-10-04', None]),
+        })
+
+        cleaned, _ = clean_tickets(tickets)
+
+        self.assertEqual(list(cleaned['ticket_status']), ['In Progress', 'Resolved', 'Open'])
+        self.assertTrue(pd.isna(cleaned['resolution_date'].iloc[0]))
+
+
+class ChunkedUsageTest(unittest.TestCase):
+    """The streamed usage passes against the same cleaning done on the whole frame"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+        Path('data').mkdir()
+        usage = pd.DataFrame(USAGE_ROWS, columns=USAGE_COLUMNS[:4])
+        usage['call_minutes'] = 10
+        usage['sms_count'] = 2
+        usage['roaming_charges'] = 0.0
+        usage.to_csv('data/usage_records.csv', index=False)
+
+        self.subscribers = pd.DataFrame({
+            'subscriber_id': ['S1', 'S2', 'S3'],
+            'activation_date': pd.to_datetime(['2025-01-01', '2025-01-01', '2025-01-01']),
+        })
+        self.raw = pd.read_csv('data/usage_records.csv', dtype=NUMERIC_DTYPES, parse_dates=['usage_date'])
+
+        patcher = mock.patch.object(clean_data_script, 'USAGE_CHUNKSIZE', 3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def expected_usage(self):
+        """Baseline cleaning of the whole usage frame at once"""
+        usage = self.raw.drop_duplicates(subset=['usage_id'], keep='first').copy()
+        sub_avg = usage.groupby('subscriber_id')['data_usage_gb'].transform('mean')
+        usage['data_usage_gb'] = usage['data_usage_gb'].fillna(sub_avg).fillna(0)
+
+        extreme_usage_mask = usage['data_usage_gb'] > 100
+        usage['outlier_flag'] = extreme_usage_mask
+        usage.loc[extreme_usage_mask, 'data_usage_gb'] = 100
+
+        activation = usage['subscriber_id'].map(self.subscribers.set_index('subscriber_id')['activation_date'])
+        return usage[usage['usage_date'] >= activation].reset_index(drop=True)
+
+    def test_averages_match_whole_frame_groupby(self):
+        sub_avg, missing_usage = clean_data_script.usage_subscriber_averages()
+
+        deduplicated = self.raw.drop_duplicates(subset=['usage_id'], keep='first')
+        expected = deduplicated.groupby('subscriber_id')['data_usage_gb'].mean().astype('float32')
+        pd.testing.assert_series_equal(sub_avg.sort_index(), expected, check_names=False)
+        self.assertEqual(sub_avg['S1'], 4.0)
+        self.assertEqual(missing_usage, deduplicated['data_usage_gb'].isna().sum())
+
+    def test_cleaned_usage_matches_whole_frame_cleaning(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            sub_avg, missing_usage = clean_data_script.usage_subscriber_averages()
+            stats = clean_data_script.clean_usage_in_chunks(self.subscribers, sub_avg, missing_usage)
+
+        cleaned = pd.read_parquet('data_cleaned/usage_records_clean.parquet')
+        expected = self.expected_usage()
+        pd.testing.assert_frame_equal(cleaned, expected)
+        self.assertEqual(stats['duplicates'], 3)
+        self.assertEqual(stats['rows'], len(expected))
+        self.assertEqual(stats['before_activation'], 1)
+
+    def test_header_only_file_gives_no_averages(self):
+        pd.DataFrame(columns=USAGE_COLUMNS).to_csv('data/usage_records.csv', index=False)
+
+        sub_avg, missing_usage = clean_data_script.usage_subscriber_averages()
+
+        self.assertTrue(sub_avg.empty)
+        self.assertEqual(missing_usage, 0)
+
+
+class RecodeCategoriesTest(unittest.TestCase):
+    """recode_categories against replacing the labels on an object column"""
+
+    def assert_matches_replace(self, series, mapping):
+        recoded = recode_categories(series, mapping)
+        expected = series.astype(object).replace(mapping)
+        pd.testing.assert_series_equal(recoded.astype(object), expected)
+        return recoded
+
+    def test_unsorted_categories_merge_into_existing_label(self):
+        series = pd.Series(
+            pd.Categorical(['dubai', 'Sharjah', None, 'Dubai', 'DXB'],
+                           categories=['Sharjah', 'dubai', 'DXB', 'Dubai']),
+            index=[10, 11, 12, 13, 14],
+            name='city'
+        )
+
+        recoded = self.assert_matches_replace(series, {'dubai': 'Dubai', 'DXB': 'Dubai'})
+
+        self.assertEqual(list(recoded.cat.categories), ['Sharjah', 'Dubai'])
+
+    def test_merge_into_earlier_label_shifts_codes(self):
+        series = pd.Series(pd.Categorical(['c', 'a', 'b', 'c'], categories=['c', 'b', 'a']))
+
+        recoded = self.assert_matches_replace(series, {'a': 'c'})
+
+        self.assertEqual(list(recoded.cat.categories), ['c', 'b'])
+        self.assertEqual(list(recoded.cat.codes), [0, 0, 1, 0])
+
+    def test_mapping_without_present_labels_returns_input(self):
+        series = pd.Series(pd.Categorical(['Open', 'Closed']))
+
+        self.assertIs(recode_categories(series, {'open': 'Open'}), series)
+
+
+class CategoryMaskTest(unittest.TestCase):
+    """category_mask against comparing the labels directly"""
+
+    def setUp(self):
+        self.series = pd.Series(
+            pd.Categorical(['Paid', None, 'Overdue', 'Paid'], categories=['Pending', 'Paid', 'Overdue']),
+            index=[5, 6, 7, 8]
+        )
+
+    def test_present_label(self):
+        for label in ['Paid', 'Overdue', 'Pending']:
+            pd.testing.assert_series_equal(category_mask(self.series, label), self.series == label)
+
+    def test_absent_label(self):
+        pd.testing.assert_series_equal(category_mask(self.series, 'Unpaid'), self.series == 'Unpaid')
+
+
+@unittest.skipUnless(HAS_DASHBOARD_DEPS, "streamlit and plotly are not installed")
+class DashboardCountsTest(unittest.TestCase):
+    """The dashboard's fast_vc and top_n against value_counts()"""
+
+    @classmethod
+    def setUpClass(cls):
+        import streamlit_telecom_app
+        cls.app = streamlit_telecom_app
+
+    def setUp(self):
+        # c, b and a tie on 2; e has no rows; missing values are not counted
+        self.series = pd.Series(
+            pd.Categorical(['b', 'a', 'c', None, 'c', 'a', 'b', 'd', None],
+                           categories=['e', 'd', 'c', 'b', 'a']),
+            name='label'
+        )
+
+    def assert_counts_equal(self, counts, expected):
+        self.assertEqual(counts.index.name, expected.index.name)
+        self.assertEqual(counts.name, expected.name)
+        self.assertEqual(dict(counts), dict(expected))
+        self.assertEqual(list(counts), list(expected))
+
+    def test_fast_vc_matches_value_counts(self):
+        counts = self.app.fast_vc(self.series)
+        expected = self.series.value_counts()
+
+        self.assert_counts_equal(counts, expected)
+        self.assertEqual(list(counts.index), list(expected.index))
+
+    def test_fast_vc_weights_match_groupby_sum(self):
+        weights = np.arange(len(self.series))
+
+        counts = self.app.fast_vc(self.series, weights)
+
+        expected = pd.Series(weights).groupby(self.series, observed=False).sum()
+        self.assertEqual(dict(counts), dict(expected))
+
+    def test_top_n_breaks_ties_in_category_order(self):
+        top = self.app.top_n(self.series, 2)
+
+        self.assertEqual(list(top.index), ['c', 'b'])
+        self.assert_counts_equal(top, self.series.value_counts().loc[['c', 'b']])
+
+    def test_top_n_at_least_category_count_returns_every_label(self):
+        for n in [5, 9]:
+            top = self.app.top_n(self.series, n)
+
+            self.assertEqual(list(top.index), ['c', 'b', 'a', 'd', 'e'])
+            self.assertEqual(dict(top), dict(self.series.value_counts()))
+
+    def test_top_n_counts_match_value_counts(self):
+        rng = np.random.default_rng(0)
+        categories = [f'L{i}' for i in rng.permutation(12)]
+        series = pd.Series(pd.Categorical(rng.choice(categories + [None], 200), categories=categories))
+
+        for n in range(1, 14):
+            top = self.app.top_n(series, n)
+            expected = series.value_counts()
+
+            self.assertEqual(list(top), list(expected.head(n)))
+            self.assertEqual(dict(top), {label: expected[label] for label in top.index})
+
+
+if __name__ == '__main__':
+    unittest.main()